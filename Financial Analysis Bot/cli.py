@@ -7,20 +7,20 @@ Main commands:
 """
 
 import csv
+from dataclasses import astuple
 from pathlib import Path
 from typing import Optional, List
 
 import click
-import pandas as pd
 
-from src.finbot.agent import analyze, analyze_from_urls, crawl_from_index
+from src.finbot.agent import ROW_FIELDS, Row, analyze, analyze_from_urls, crawl_from_index
 
 
-def _rows_from_inputs(urls: Optional[List[str]], query_text: Optional[str], crawl: bool, max_crawl: int, max_results: int) -> List[dict]:
+def _rows_from_inputs(urls: Optional[List[str]], query_text: Optional[str], crawl: bool, max_crawl: int, max_results: int) -> List[Row]:
 	"""Decide how to get rows based on either URLs (with optional crawl) or a search query."""
 	if urls:
 		if crawl:
-			rows: List[dict] = []
+			rows: List[Row] = []
 			for u in urls:
 				rows.extend(crawl_from_index(u, max_links=max_crawl))
 			return rows
@@ -30,11 +30,13 @@ def _rows_from_inputs(urls: Optional[List[str]], query_text: Optional[str], craw
 	return []
 
 
-def _write_csv(rows: List[dict], out: Path) -> int:
-	"""Write rows to CSV and return the number of rows written."""
-	df = pd.DataFrame(rows)
-	df.to_csv(out, index=False, quoting=csv.QUOTE_MINIMAL)
-	return len(df)
+def _write_csv(rows: List[Row], out: Path) -> int:
+	"""Write rows to CSV one at a time and return the number of rows written."""
+	with out.open("w", newline="", encoding="utf-8") as f:
+		writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+		writer.writerow(ROW_FIELDS)
+		writer.writerows(astuple(r) for r in rows)
+	return len(rows)
 
 
 @click.group()
@@ -75,21 +77,19 @@ def research(query: tuple[str, ...], urls: tuple[str, ...], crawl: bool, max_cra
 @click.option("--out", type=click.Path(path_type=Path), required=False, help="Optional CSV path to write sources and summary")
 def chat(message: Optional[str], urls: tuple[str, ...], max_results: int, out: Optional[Path]) -> None:
 	"""Chat with the finance bot. Provide --message for single-turn or enter interactive mode."""
-	def run_once(prompt: str) -> pd.DataFrame:
+	def run_once(prompt: str) -> List[Row]:
 		urls_list: Optional[List[str]] = list(urls) if urls else None
-		rows = _rows_from_inputs(urls_list, prompt, crawl=False, max_crawl=0, max_results=max_results)
-		return pd.DataFrame(rows)
+		return _rows_from_inputs(urls_list, prompt, crawl=False, max_crawl=0, max_results=max_results)
 
 	if message:
-		df = run_once(message)
-		if df.empty:
+		rows = run_once(message)
+		if not rows:
 			click.echo("No results found.")
 			return
-		summaries = df["summary"].dropna().tolist()
-		click.echo("\n".join(summaries) if summaries else "No narrative could be composed from sources.")
+		click.echo("\n".join(r.summary for r in rows))
 		if out:
-			df.to_csv(out, index=False, quoting=csv.QUOTE_MINIMAL)
-			click.echo(f"Wrote {len(df)} rows to {out}")
+			count = _write_csv(rows, out)
+			click.echo(f"Wrote {count} rows to {out}")
 		return
 
 	click.echo("Finance Chatbot (type 'exit' to quit). Ask about companies, earnings, metrics...")
@@ -102,15 +102,14 @@ def chat(message: Optional[str], urls: tuple[str, ...], max_results: int, out: O
 		if prompt.strip().lower() in {"exit", "quit"}:
 			click.echo("Bye.")
 			return
-		df = run_once(prompt)
-		if df.empty:
+		rows = run_once(prompt)
+		if not rows:
 			click.echo("No results found.")
 			continue
-		summaries = df["summary"].dropna().tolist()
-		click.echo("\n".join(summaries) if summaries else "No narrative could be composed from sources.")
+		click.echo("\n".join(r.summary for r in rows))
 		if out:
-			df.to_csv(out, index=False, quoting=csv.QUOTE_MINIMAL)
-			click.echo(f"Wrote {len(df)} rows to {out}")
+			count = _write_csv(rows, out)
+			click.echo(f"Wrote {count} rows to {out}")
 
 
 if __name__ == "__main__":
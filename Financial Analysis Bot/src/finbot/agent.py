@@ -11,23 +11,85 @@ Public functions you can call:
 - analyze(query, max_results): search the web, then analyze each result
 - analyze_from_urls(urls): analyze specific URLs you pass in
 - crawl_from_index(index_url, max_links): discover press-release links on an index page
+- aanalyze / aanalyze_from_urls: async versions for use inside an event loop (e.g. the web app)
+- new_client(): a shared HTTP client a long-running app can pass to the async versions
+
+Each result is a Row; ROW_FIELDS lists its columns in CSV order.
 """
 
+import asyncio
 import json
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse, urljoin, quote_plus
-
-import requests
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from dataclasses import dataclass, fields
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse, urljoin, quote_plus, parse_qsl, urlencode, urlunparse
+
+import hishel
+import httpx
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 import trafilatura
-from duckduckgo_search import DDGS
+from duckduckgo_search import AsyncDDGS
+
+try:
+	# Optional: google-re2 matches in linear time without Python-level backtracking
+	import re2 as _re_fast
+except ImportError:
+	_re_fast = re
+
+try:
+	# Optional: uvloop's C event loop speeds up the concurrent fetches
+	import uvloop
+except ImportError:
+	uvloop = None
 
 
 # ---------------------------
 # Core helpers (simple)
 # ---------------------------
 
+_HEADERS = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
+_TIMEOUT = 20
+# Max open connections per client
+_MAX_CONNECTIONS = 64
+_MAX_KEEPALIVE = 32
+# Max parallel requests to one host while crawling, so a single site is not hammered
+_PER_HOST_LIMIT = 8
+# Response bodies are cut off at this size where they come off the wire, before the
+# cache stores them, so one huge page can't eat memory, disk or regex time
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+_CHUNK_BYTES = 64 * 1024
+# Retry transient gateway errors; httpx's own retries only cover failed connects
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.2  # seconds, doubled per attempt
+# On-disk HTTP cache so re-running the same query or crawl skips the network
+_CACHE_PATH = Path(".finbot_cache")
+_CACHE_EXPIRE_SECONDS = 3600
+# Text extraction and regex work is CPU-bound, so batches are parsed in worker processes
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# Regex patterns are compiled once at import instead of on every call.
+# The figure patterns are simple on purpose and match many press releases. Each is a
+# single search over the text, so re2 (when installed) gets one linear scan per figure;
+# flags are inline so both engines accept the same pattern text.
+_RE_WS = re.compile(r"\s+")
+_RE_MONEY = _re_fast.compile(r"(?i)\$?\s*([0-9.,]+)\s*(billion|bn|million|mn|thousand|k)?")
+_RE_REVENUE = _re_fast.compile(r"(?i)(?:total\s+)?revenue\s*(?:was|were|of|to)\s*([^\.\;\n]+)")
+_RE_NET_INCOME = _re_fast.compile(r"(?i)(?:gaap\s+)?net\s+income\s*(?:was|were|of|to)\s*([^\.\;\n]+)")
+_RE_EPS = _re_fast.compile(r"(?i)earnings\s+per\s+share[^\.\n]*?\s(?:was|were|of|to)\s*([^\.\;\n]+)")
+_RE_YOY = _re_fast.compile(r"(?i)(?:year[- ]over[- ]year|YoY)[^0-9%]*([+\-]?[0-9.,]+\s*%)")
+_RE_PRESS_LINK = re.compile(r"press[-]?release|news[-]?release|financial-results|financial-results|earnings", re.I)
+
+
+@lru_cache(maxsize=2048)
 def _normalize_url(url: str) -> str:
 	"""Ensure a URL has a scheme (https) so requests can fetch it."""
 	if not url:
@@ -38,36 +100,165 @@ def _normalize_url(url: str) -> str:
 	return url
 
 
-def _fetch_html(url: str) -> Optional[str]:
-	"""Download the raw HTML of a page. Returns None if it fails."""
+@lru_cache(maxsize=2048)
+def _canonical_url(url: str) -> str:
+	"""Drop tracking params (utm_*) and the #fragment, which don't change the page."""
+	parsed = urlparse(url)
+	params = parse_qsl(parsed.query, keep_blank_values=True)
+	kept = [(k, v) for k, v in params if not k.lower().startswith("utm_")]
+	query = urlencode(kept) if len(kept) != len(params) else parsed.query
+	return urlunparse(parsed._replace(query=query, fragment=""))
+
+
+def _dedupe_key(url: str) -> str:
+	"""Key for spotting the same page twice: canonical URL, ignoring a trailing slash on the path."""
+	parsed = urlparse(url)
+	return urlunparse(parsed._replace(path=parsed.path.rstrip("/")))
+
+
+def _unique_urls(urls: Iterable[str]) -> List[str]:
+	"""Normalize and canonicalize URLs, keeping only the first URL for each page."""
+	unique: Dict[str, str] = {}
+	for u in urls:
+		url = _canonical_url(_normalize_url(u))
+		unique.setdefault(_dedupe_key(url), url)
+	return list(unique.values())
+
+
+class _CappedStream(httpx.AsyncByteStream):
+	"""Response body stream that stops after _MAX_PAGE_BYTES and closes the connection stream."""
+
+	def __init__(self, stream: httpx.AsyncByteStream) -> None:
+		self._stream = stream
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		remaining = _MAX_PAGE_BYTES
+		async for chunk in self._stream:
+			yield chunk[:remaining]
+			remaining -= len(chunk)
+			if remaining <= 0:
+				break
+
+	async def aclose(self) -> None:
+		await self._stream.aclose()
+
+
+class _CappedTransport(httpx.AsyncBaseTransport):
+	"""Network transport whose response bodies are capped, so the cache above never sees more."""
+
+	def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+		self._transport = transport
+
+	async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+		resp = await self._transport.handle_async_request(request)
+		headers = [(k, v) for k, v in resp.headers.raw if k.lower() != b"content-length"]
+		return httpx.Response(
+			status_code=resp.status_code,
+			headers=headers,
+			stream=_CappedStream(resp.stream),
+			extensions=resp.extensions,
+			request=request,
+		)
+
+	async def aclose(self) -> None:
+		await self._transport.aclose()
+
+
+def new_client() -> httpx.AsyncClient:
+	"""Create a pooled, disk-cached HTTP/2 client (many pages on one host share a connection)."""
+	limits = httpx.Limits(max_connections=_MAX_CONNECTIONS, max_keepalive_connections=_MAX_KEEPALIVE)
+	network = _CappedTransport(httpx.AsyncHTTPTransport(http2=True, limits=limits))
+	storage = hishel.AsyncFileStorage(base_path=_CACHE_PATH, ttl=_CACHE_EXPIRE_SECONDS)
+	# force_cache: keep pages for the TTL even when the site sends no caching headers
+	controller = hishel.Controller(cacheable_methods=["GET"], force_cache=True)
+	return httpx.AsyncClient(
+		transport=hishel.AsyncCacheTransport(transport=network, storage=storage, controller=controller),
+		timeout=_TIMEOUT,
+		headers=_HEADERS,
+		follow_redirects=True,
+	)
+
+
+async def _afetch_html(client: httpx.AsyncClient, url: str) -> Optional[str]:
+	"""Download the raw HTML of a page on a shared client. Returns None if it fails.
+
+	Gateway errors (502/503/504) are retried a few times with a short backoff.
+	"""
 	try:
-		headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
-		resp = requests.get(url, headers=headers, timeout=20)
-		if resp.status_code != 200:
-			return None
-		return resp.text
+		for attempt in range(_RETRY_ATTEMPTS):
+			if attempt:
+				await asyncio.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+			async with client.stream("GET", url) as resp:
+				if resp.status_code in _RETRY_STATUSES:
+					continue
+				if resp.status_code != 200:
+					return None
+				chunks: List[bytes] = []
+				remaining = _MAX_PAGE_BYTES
+				async for chunk in resp.aiter_bytes(_CHUNK_BYTES):
+					chunks.append(chunk[:remaining])
+					remaining -= len(chunk)
+					if remaining <= 0:
+						break
+				body = b"".join(chunks)
+				try:
+					return body.decode(resp.charset_encoding or "utf-8", "replace")
+				except LookupError:
+					# Unknown charset label in Content-Type: decode leniently instead of losing the page
+					return body.decode("utf-8", "replace")
+		return None
 	except Exception:
 		return None
 
 
-def _extract_text(url: str, html: Optional[str]) -> Optional[str]:
-	"""Try to extract clean text using trafilatura; fall back to plain HTML text."""
-	# Prefer trafilatura (handles boilerplate); fall back to visible text from HTML
+def _extract_text(url: str, html: Optional[str]) -> Tuple[Optional[str], Dict[str, Any]]:
+	"""Return (text, figures) for a page, running trafilatura only when plain text finds no figures."""
+	if not html:
+		return None, {}
+	# Cheap path first: press releases usually state their figures plainly, so the
+	# page's visible text is enough and trafilatura's boilerplate removal can be skipped
+	try:
+		quick = _RE_WS.sub(" ", _visible_text(html)).strip() or None
+	except Exception:
+		quick = None
+	figs = extract_financial_figures(quick or "")
+	if figs:
+		return quick, figs
+	# Otherwise try trafilatura (handles boilerplate) on the HTML we already downloaded;
+	# fall back to the visible text from HTML
 	try:
-		extracted = trafilatura.extract(trafilatura.fetch_url(url), include_comments=False, include_tables=False)
+		extracted = trafilatura.extract(html, url=url, include_comments=False, include_tables=False)
 		if extracted:
-			return extracted
+			return extracted, extract_financial_figures(extracted)
 	except Exception:
 		pass
-	if not html:
-		return None
+	return quick, figs
+
+
+def _visible_text(html: str) -> str:
+	"""Return the page text without scripts/styles, using lxml directly (BeautifulSoup if lxml can't parse it)."""
 	try:
+		tree = lxml_html.fromstring(html)
+		for el in tree.xpath("//script|//style|//noscript|//template"):
+			el.drop_tree()
+		return " ".join(tree.itertext())
+	except Exception:
 		soup = BeautifulSoup(html, "lxml")
 		for tag in soup(["script", "style", "noscript", "template"]):
 			tag.extract()
-		text = soup.get_text(" ")
-		text = re.sub(r"\s+", " ", text).strip()
-		return text if text else None
+		return soup.get_text(" ")
+
+
+def _page_title(html: str) -> Optional[str]:
+	"""Return the text of the page's <title> tag, or None if there isn't one."""
+	try:
+		title = lxml_html.fromstring(html).findtext(".//title")
+		return title.strip() if title is not None else None
+	except Exception:
+		pass
+	try:
+		title_tag = BeautifulSoup(html, "lxml").find("title")
+		return title_tag.get_text(strip=True) if title_tag else None
 	except Exception:
 		return None
 
@@ -86,7 +277,7 @@ def _to_float(num_str: str) -> Optional[float]:
 
 def _parse_money(value: str) -> Optional[float]:
 	"""Parse amounts like '$14.9 billion' into a numeric value in USD."""
-	m = re.search(r"\$?\s*([0-9.,]+)\s*(billion|bn|million|mn|thousand|k)?", value, re.I)
+	m = _RE_MONEY.search(value)
 	if not m:
 		return None
 	num = _to_float(m.group(1))
@@ -106,32 +297,25 @@ def extract_financial_figures(text: str) -> Dict[str, Any]:
 	"""Find simple financial figures in text using friendly regex patterns."""
 	if not text:
 		return {}
-	text_norm = re.sub(r"\s+", " ", text)
+	text_norm = _RE_WS.sub(" ", text)
 	figs: Dict[str, Any] = {}
-	# Simple patterns that match many press releases. These are intentionally basic.
-	patterns = {
-		"revenue": r"(?:total\s+)?revenue\s*(?:was|were|of|to)\s*([^\.\;\n]+)",
-		"net_income": r"(?:gaap\s+)?net\s+income\s*(?:was|were|of|to)\s*([^\.\;\n]+)",
-		"eps": r"earnings\s+per\s+share[^\.\n]*?\s(?:was|were|of|to)\s*([^\.\;\n]+)",
-		"yoy": r"(?:year[- ]over[- ]year|YoY)[^0-9%]*([+\-]?[0-9.,]+\s*%)",
-	}
-	m = re.search(patterns["revenue"], text_norm, re.I)
+	m = _RE_REVENUE.search(text_norm)
 	if m:
 		val = _parse_money(m.group(1))
 		if val is not None:
 			figs["revenue"] = val
-	m = re.search(patterns["net_income"], text_norm, re.I)
+	m = _RE_NET_INCOME.search(text_norm)
 	if m:
 		val = _parse_money(m.group(1))
 		if val is not None:
 			figs["net_income"] = val
-	m = re.search(patterns["eps"], text_norm, re.I)
+	m = _RE_EPS.search(text_norm)
 	if m:
 		candidate = m.group(1).replace("$", "").split()[0]
 		val = _to_float(candidate)
 		if val is not None:
 			figs["eps"] = val
-	m = re.search(patterns["yoy"], text_norm, re.I)
+	m = _RE_YOY.search(text_norm)
 	if m:
 		pct = _to_float(m.group(1).replace("%", ""))
 		if pct is not None:
@@ -160,92 +344,228 @@ def compose_summary(title: Optional[str], figs: Dict[str, Any]) -> str:
 # Row assembly
 # ---------------------------
 
-def _build_row(url: str, title: Optional[str], text: Optional[str]) -> Dict[str, Any]:
-	"""Create one CSV-ready dictionary row for a given page."""
-	host = urlparse(url).netloc
-	figs = extract_financial_figures(text or "")
-	summary = compose_summary(title, figs)
-	return {
-		"title": title,
-		"url": url,
-		"site": host,
-		"author": None,
-		"date": None,
-		"snippet": None,
-		"language": None,
-		"length_chars": len(text or ""),
-		"revenue_usd": figs.get("revenue"),
-		"net_income_usd": figs.get("net_income"),
-		"eps": figs.get("eps"),
-		"yoy_percent": figs.get("yoy_percent"),
-		"guidance": None,
-		"summary": summary,
-	}
+@dataclass(slots=True)
+class Row:
+	"""One CSV row describing a page. Slots keep many rows cheap in memory."""
+	title: Optional[str]
+	url: str
+	site: str
+	author: Optional[str] = None
+	date: Optional[str] = None
+	snippet: Optional[str] = None
+	language: Optional[str] = None
+	length_chars: int = 0
+	revenue_usd: Optional[float] = None
+	net_income_usd: Optional[float] = None
+	eps: Optional[float] = None
+	yoy_percent: Optional[float] = None
+	guidance: Optional[str] = None
+	summary: str = ""
+
+
+# CSV header, in column order
+ROW_FIELDS = tuple(f.name for f in fields(Row))
+
+
+def _build_row(url: str, host: str, title: Optional[str], text: Optional[str], figs: Dict[str, Any]) -> Row:
+	"""Create one CSV-ready row for a given page (host is the URL's netloc, figs come from its text)."""
+	return Row(
+		title=title,
+		url=url,
+		site=host,
+		length_chars=len(text or ""),
+		revenue_usd=figs.get("revenue"),
+		net_income_usd=figs.get("net_income"),
+		eps=figs.get("eps"),
+		yoy_percent=figs.get("yoy_percent"),
+		summary=compose_summary(title, figs),
+	)
 
 
 # ---------------------------
-# Public API (preserved)
+# Page -> row pipeline
 # ---------------------------
 
-def analyze_from_urls(urls: List[str]) -> List[Dict[str, Any]]:
-	"""Analyze specific URLs you provide and return CSV-ready rows."""
-	rows: List[Dict[str, Any]] = []
-	for u in urls:
-		url = _normalize_url(u)
-		html = _fetch_html(url)
-		title = None
-		if html:
-			try:
-				soup = BeautifulSoup(html, "lxml")
-				title_tag = soup.find("title")
-				title = title_tag.get_text(strip=True) if title_tag else None
-			except Exception:
-				title = None
-		text = _extract_text(url, html)
-		rows.append(_build_row(url, title, text))
-	return rows
-
-
-def analyze(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-	"""Search the web (DuckDuckGo) for a query, then analyze each result."""
+def _page_to_row(url: str, host: str, html: Optional[str]) -> Row:
+	"""Turn one downloaded page (or None if the fetch failed) into a CSV-ready row."""
+	title = _page_title(html) if html else None
+	text, figs = _extract_text(url, html)
+	return _build_row(url, host, title, text, figs)
+
+
+def _parse_pool() -> Optional[ProcessPoolExecutor]:
+	"""Create the parse process pool on first use, or return None where it can't be used.
+
+	Daemonic processes (e.g. hypercorn's workers) may not start children, so they parse in a thread.
+	"""
+	global _PARSE_POOL
+	if _PARSE_POOL is None and not multiprocessing.current_process().daemon:
+		# forkserver: workers don't inherit the event loop, client or other threads by forking (POSIX only)
+		method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+		_PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(method))
+	return _PARSE_POOL
+
+
+def _drop_parse_pool(pool: ProcessPoolExecutor) -> None:
+	"""Shut down a failed pool and forget it, so the next batch starts a fresh one."""
+	global _PARSE_POOL
+	if _PARSE_POOL is pool:
+		_PARSE_POOL = None
+	pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pages_to_rows_sync(urls: List[str], hosts: List[str], pages: List[Optional[str]]) -> List[Row]:
+	return [_page_to_row(url, host, html) for url, host, html in zip(urls, hosts, pages)]
+
+
+async def _pages_to_rows(urls: List[str], hosts: List[str], pages: List[Optional[str]]) -> List[Row]:
+	"""Build rows for downloaded pages, spreading several pages across CPU cores.
+
+	One page isn't worth a process; it is parsed in a thread so the event loop stays free.
+	"""
+	pool = _parse_pool() if len(urls) > 1 else None
+	if pool is None:
+		return await asyncio.to_thread(_pages_to_rows_sync, urls, hosts, pages)
+	# Small chunks for small batches so every core still gets work
+	chunksize = max(1, min(8, len(urls) // ((os.cpu_count() or 1) * 4)))
+	try:
+		return await asyncio.to_thread(lambda: list(pool.map(_page_to_row, urls, hosts, pages, chunksize=chunksize)))
+	except BrokenProcessPool:
+		# A worker died
+		_drop_parse_pool(pool)
+		raise
+	except OSError:
+		# Worker processes could not be started (e.g. a process limit): parse in a thread instead
+		_drop_parse_pool(pool)
+		return await asyncio.to_thread(_pages_to_rows_sync, urls, hosts, pages)
+
+
+@asynccontextmanager
+async def _client_scope(client: Optional[httpx.AsyncClient]) -> AsyncIterator[httpx.AsyncClient]:
+	"""Use the caller's shared client, or open one just for this call."""
+	if client is not None:
+		yield client
+		return
+	async with new_client() as own:
+		yield own
+
+
+async def _gather_rows(urls: List[str], client: Optional[httpx.AsyncClient] = None) -> List[Row]:
+	"""Fetch every distinct URL at once on one client, then build rows in the original order."""
+	normalized = _unique_urls(urls)
+	hosts = [urlparse(u).netloc for u in normalized]
+	async with _client_scope(client) as client:
+		pages = await asyncio.gather(*[_afetch_html(client, u) for u in normalized])
+	return await _pages_to_rows(normalized, hosts, pages)
+
+
+async def _asearch_links(query: str, max_results: int) -> AsyncIterator[str]:
+	"""Search DuckDuckGo and yield the result URLs.
+
+	atext runs the blocking search in a thread and returns the whole list when it
+	finishes, so the first URL is only yielded after the search is complete.
+	"""
 	# Simpler search: use DDG HTML backend; return top N results
-	links: List[str] = []
 	try:
-		with DDGS() as ddgs:
-			for r in ddgs.text(query, max_results=max_results, safesearch="Off", backend="html"):
-				href = _normalize_url(r.get("href"))
-				if href:
-					links.append(href)
+		async with AsyncDDGS() as ddgs:
+			results = await ddgs.atext(query, max_results=max_results, safesearch="Off", backend="html")
 	except Exception:
-		pass
-	if not links:
+		return
+	for r in results or []:
+		href = _normalize_url(r.get("href"))
+		if href:
+			yield href
+
+
+def _run(coro):
+	"""Run a coroutine to completion on a fresh event loop, uvloop's when installed.
+
+	The loop is chosen per call, so importing this module never swaps the global
+	event loop policy for the host application.
+	"""
+	loop_factory = uvloop.new_event_loop if uvloop is not None else None
+	with asyncio.Runner(loop_factory=loop_factory) as runner:
+		return runner.run(coro)
+
+
+# ---------------------------
+# Public API (preserved)
+# ---------------------------
+
+async def aanalyze_from_urls(urls: List[str], client: Optional[httpx.AsyncClient] = None) -> List[Row]:
+	"""Async version of analyze_from_urls for callers already inside an event loop.
+
+	Pass a client from new_client() to reuse its connections and cache across calls.
+	"""
+	if not urls:
 		return []
-	return analyze_from_urls(links)
+	return await _gather_rows(urls, client)
+
+
+def analyze_from_urls(urls: List[str]) -> List[Row]:
+	"""Analyze specific URLs you provide and return CSV-ready rows.
+
+	All pages are downloaded concurrently, so the wait is roughly the slowest page
+	rather than the sum of all of them.
+	"""
+	return _run(aanalyze_from_urls(urls))
 
 
-def _discover_press_release_links(index_url: str, max_links: int = 3) -> List[str]:
-	"""Find likely press-release detail links on an index page (same site)."""
+async def aanalyze(query: str, max_results: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[Row]:
+	"""Async version of analyze for callers already inside an event loop (client as in aanalyze_from_urls)."""
+	links = [u async for u in _asearch_links(query, max_results)]
+	return await aanalyze_from_urls(links, client)
+
+
+def analyze(query: str, max_results: int = 10) -> List[Row]:
+	"""Search the web (DuckDuckGo) for a query, then analyze each result."""
+	return _run(aanalyze(query, max_results))
+
+
+def _discover_press_release_links(index_url: str, html: str, max_links: int = 3) -> List[str]:
+	"""Find likely press-release detail links in an index page's HTML (same site)."""
 	try:
-		html = _fetch_html(index_url)
-		if not html:
-			return []
-		soup = BeautifulSoup(html, "lxml")
-		candidates: List[str] = []
-		for a in soup.find_all("a", href=True):
-			href = a["href"].strip()
-			text = a.get_text(" ", strip=True).lower()
-			abs_url = urljoin(index_url, href)
-			if re.search(r"press[-]?release|news[-]?release|financial-results|financial-results|earnings", href, re.I) or \
+		tree = lxml_html.fromstring(html)
+		# Several anchors often point at the same release; keep one per page
+		candidates: Dict[str, str] = {}
+		for a in tree.iterfind(".//a[@href]"):
+			href = a.get("href").strip()
+			text = _RE_WS.sub(" ", " ".join(a.itertext())).strip().lower()
+			abs_url = _canonical_url(urljoin(index_url, href))
+			if _RE_PRESS_LINK.search(href) or \
 			   ("press release" in text or "financial results" in text or "earnings" in text):
-				candidates.append(abs_url)
+				candidates.setdefault(_dedupe_key(abs_url), abs_url)
 			if len(candidates) >= max_links:
 				break
-		return candidates
+		return list(candidates.values())
 	except Exception:
 		return []
 
 
-def crawl_from_index(index_url: str, max_links: int = 5) -> List[Dict[str, Any]]:
+async def _acrawl(index_url: str, max_links: int) -> List[Row]:
+	"""Fetch an index page and its discovered detail pages on one client."""
+	index_url = _normalize_url(index_url)
+	per_host: Dict[str, asyncio.Semaphore] = {}
+
+	async def fetch(url: str) -> Optional[str]:
+		# Discovered links may point off-site; each host gets its own limit
+		host = urlparse(url).netloc
+		if host not in per_host:
+			per_host[host] = asyncio.Semaphore(_PER_HOST_LIMIT)
+		async with per_host[host]:
+			return await _afetch_html(client, url)
+
+	async with new_client() as client:
+		index_html = await fetch(index_url)
+		links = _discover_press_release_links(index_url, index_html, max_links=max_links) if index_html else []
+		if not links:
+			# Nothing discovered: analyze the index page itself (already downloaded)
+			links, pages = [index_url], [index_html]
+		else:
+			pages = await asyncio.gather(*[fetch(u) for u in links])
+	return await _pages_to_rows(links, [urlparse(u).netloc for u in links], pages)
+
+
+def crawl_from_index(index_url: str, max_links: int = 5) -> List[Row]:
 	"""If you pass an index page, try to discover detail pages and analyze them."""
-	links = _discover_press_release_links(index_url, max_links=max_links)
-	return analyze_from_urls(links or [index_url])
+	return _run(_acrawl(index_url, max_links))
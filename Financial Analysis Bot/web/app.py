@@ -1,64 +1,89 @@
 """
-Minimal Flask web app to chat with the finance bot.
+Minimal Quart (async Flask) web app to chat with the finance bot.
 Open http://127.0.0.1:5000 in your browser.
+
+Run it under an ASGI server so requests don't wait on each other's crawls:
+    hypercorn web.app:app -k uvloop -w 2 --bind 127.0.0.1:5000
+(use -k asyncio where uvloop isn't installed, e.g. on Windows)
 """
 
 from pathlib import Path
 from typing import List
 import sys
+import csv
+from dataclasses import astuple
 from io import StringIO
 
-from flask import Flask, render_template, request, jsonify, Response
-import pandas as pd
+import orjson
+from quart import Quart, render_template, request, Response
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
 	sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.finbot.agent import analyze, analyze_from_urls
+from src.finbot.agent import ROW_FIELDS, aanalyze, aanalyze_from_urls, new_client
+
+app = Quart(__name__, static_folder="static", template_folder="templates")
+
+# One HTTP client for the whole server, so requests share connections and the page cache
+_http_client = None
+
+
+@app.before_serving
+async def open_http_client():
+	"""Create the shared HTTP client on the server's event loop."""
+	global _http_client
+	_http_client = new_client()
+
 
-app = Flask(__name__, static_folder="static", template_folder="templates")
+@app.after_serving
+async def close_http_client():
+	"""Close the shared HTTP client's connections on shutdown."""
+	await _http_client.aclose()
 
 
 @app.get("/")
-def index():
+async def index():
 	"""Serve the chat UI page."""
-	return render_template("index.html")
+	return await render_template("index.html")
 
 
 @app.post("/api/chat")
-def chat_api():
+async def chat_api():
 	"""Simple JSON API: send message and optional URLs, get summaries and rows back."""
-	data = request.get_json(silent=True) or {}
+	data = await request.get_json(silent=True) or {}
 	message: str = data.get("message", "")
 	urls: List[str] = data.get("urls") or []
 	max_results: int = int(data.get("max_results", 8))
 	if urls:
-		rows = analyze_from_urls(urls)
+		rows = await aanalyze_from_urls(urls, client=_http_client)
 	else:
-		rows = analyze(message, max_results=max_results)
-	df = pd.DataFrame(rows)
-	summaries = df["summary"].dropna().tolist() if not df.empty else []
-	return jsonify({
+		rows = await aanalyze(message, max_results=max_results, client=_http_client)
+	summaries = [r.summary for r in rows]
+	# orjson serializes the (possibly large) rows payload, dataclasses included, much faster than jsonify
+	body = orjson.dumps({
 		"summaries": summaries,
 		"rows": rows,
 	})
+	return Response(body, mimetype="application/json")
 
 
 @app.post("/api/chat_csv")
-def chat_csv():
+async def chat_csv():
 	"""Return a CSV built from the current chat request (message/urls)."""
-	data = request.get_json(silent=True) or {}
+	data = await request.get_json(silent=True) or {}
 	message: str = data.get("message", "")
 	urls: List[str] = data.get("urls") or []
 	max_results: int = int(data.get("max_results", 8))
 	if urls:
-		rows = analyze_from_urls(urls)
+		rows = await aanalyze_from_urls(urls, client=_http_client)
 	else:
-		rows = analyze(message, max_results=max_results)
-	df = pd.DataFrame(rows)
+		rows = await aanalyze(message, max_results=max_results, client=_http_client)
 	buf = StringIO()
-	df.to_csv(buf, index=False)
+	if rows:
+		writer = csv.writer(buf)
+		writer.writerow(ROW_FIELDS)
+		writer.writerows(astuple(r) for r in rows)
 	csv_bytes = buf.getvalue().encode("utf-8")
 	return Response(csv_bytes, mimetype="text/csv", headers={
 		"Content-Disposition": "attachment; filename=finance_results.csv"